@@ -1,5 +1,6 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import uvicorn
@@ -25,6 +26,10 @@ app = FastAPI(
     version="2.0.0"
 )
 
+# Compress large JSON responses (e.g. /gwa-report) when the client
+# advertises gzip in Accept-Encoding
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -198,11 +203,22 @@ def register_teacher(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @app.get("/api/students", response_model=List[StudentResponse])
-def get_all_students(teacher_id: Optional[int] = None, role: Optional[str] = None, db: Session = Depends(get_db)):
+def get_all_students(
+    teacher_id: Optional[int] = None,
+    role: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
     query = db.query(Student)
     if teacher_id and role != "admin":
         query = query.filter(Student.teacher_id == teacher_id)
-    students = query.order_by(Student.name).all()
+    query = query.order_by(Student.name)
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    students = query.all()
     return students
 
 
@@ -422,10 +438,11 @@ def get_analytics_overview(db: Session = Depends(get_db)):
         func.count(Student.id).label('count')
     ).group_by(Student.course_code).all()
     
-    course_distribution = [
-        {"course": course, "count": count}
-        for course, count in students_per_course
-    ]
+    # Parallel label/value arrays, ready to feed straight into the charts
+    course_distribution = {
+        "labels": [course for course, _ in students_per_course],
+        "counts": [count for _, count in students_per_course]
+    }
     
     grade_ranges = [
         {"range": "1.0 (Excellent)", "min": 1.0, "max": 1.0},
@@ -435,16 +452,14 @@ def get_analytics_overview(db: Session = Depends(get_db)):
         {"range": "3.0+ (Failed)", "min": 3.0, "max": 5.0}
     ]
     
-    grade_distribution = []
+    grade_distribution = {"labels": [], "counts": []}
     for grade_range in grade_ranges:
         count = db.query(Grade).filter(
             Grade.grade >= grade_range["min"],
             Grade.grade <= grade_range["max"]
         ).count()
-        grade_distribution.append({
-            "range": grade_range["range"],
-            "count": count
-        })
+        grade_distribution["labels"].append(grade_range["range"])
+        grade_distribution["counts"].append(count)
     
     top_performers = db.query(Student).filter(
         Student.gwa > 0,
@@ -466,10 +481,10 @@ def get_analytics_overview(db: Session = Depends(get_db)):
         func.avg(Student.gwa).label('avg_gwa')
     ).filter(Student.gwa > 0).group_by(Student.course_code).all()
     
-    course_performance = [
-        {"course": course, "avg_gwa": round(float(avg), 2)}
-        for course, avg in gwa_per_course
-    ]
+    course_performance = {
+        "labels": [course for course, _ in gwa_per_course],
+        "avg_gwa": [round(float(avg), 2) for _, avg in gwa_per_course]
+    }
     
     return {
         "total_students": total_students,
@@ -2,59 +2,197 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox, ttk
 import requests
+from urllib3.util.retry import Retry
+import ijson
+import orjson
 from typing import List, Dict, Optional
 import threading
-import json
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import concurrent.futures
+import heapq
+import math
+import time
 from PIL import Image, ImageTk
-import io
-import qrcode
-import cv2
-from pyzbar.pyzbar import decode
 import os
+import re
+import sys
 import numpy as np
+from operator import itemgetter
+from functools import lru_cache
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
 
+# Row extractors for Treeview population - one C-level call per row
+# instead of one dict lookup per column
+_GRADE_ROW = itemgetter('subject_code', 'subject_name', 'formatted_grade', 'description')
+_GWA_ROW = itemgetter('student_code', 'name', 'course_code', 'formatted_gwa', 'description')
+
+# Interned copies of values that repeat across thousands of treeview rows
+# (course codes, status descriptions) so each distinct string is allocated once
+_intern_cache = {}
+
+@lru_cache(maxsize=64)
+def _adjust_brightness(hex_color, factor):
+    """Darken/lighten a hex color; pure, so memoized across menu opens"""
+    r, g, b = bytes.fromhex(hex_color.lstrip('#'))
+    return "#%02x%02x%02x" % (int(r * factor), int(g * factor), int(b * factor))
+
+
+# Shared worker pool for the pre-login windows (login, register, portal);
+# EduCoreApp manages its own executor tied to the app lifecycle
+_IO_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="educore-auth")
+
+
+def _intern(value):
+    cached = _intern_cache.get(value)
+    if cached is None:
+        cached = _intern_cache.setdefault(value, sys.intern(str(value)))
+    return cached
+
 
 class APIClient:
+    # GET prefixes stable enough to serve from a short-lived cache, with
+    # per-resource TTLs: the course catalog rarely changes, student lists do
+    CACHE_TTLS = {'/courses': 60, '/students': 10}
+
+    # Mutating one resource can invalidate cached reads of another
+    # (grades feed the GWA column of the students list)
+    EVICT_RELATED = {'/grades': ('/students',)}
+
+    # Upper bound on cached responses before the oldest entry is dropped
+    CACHE_MAX_ENTRIES = 128
+
     def __init__(self, base_url="http://localhost:8000/api"):
         self.base_url = base_url
         self.timeout = 10
-    
+        self._url_cache = {}
+        # endpoint -> (timestamp, parsed JSON) for cacheable GETs
+        self._cache = {}
+        # endpoint -> (etag, parsed JSON) for conditional revalidation;
+        # a 304 reuses the stored body without re-parsing anything
+        self._etags = {}
+
+        # Persistent session so urllib3 keep-alive reuses TCP connections
+        # across calls instead of opening a fresh one per request. Transient
+        # failures (5xx, dropped keep-alive sockets) retry with backoff
+        # inside the call instead of surfacing as a user-visible error.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE'])
+        )
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': 'application/json'})
+        self.session.mount(
+            "http://",
+            requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=20, max_retries=retry
+            )
+        )
+
+    def close(self):
+        """Close the underlying connection pool"""
+        self.session.close()
+
+    def _url(self, endpoint):
+        """Resolve an endpoint to its full URL, caching the joined string"""
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = self.base_url + endpoint
+        return url
+
+    def _evict(self, endpoint):
+        """Drop cached GETs sharing a path root with a mutated endpoint"""
+        root = '/' + endpoint.split('/')[1]
+        roots = (root,) + self.EVICT_RELATED.get(root, ())
+        for key in [k for k in self._cache if k.startswith(roots)]:
+            del self._cache[key]
+
+    def _ttl_for(self, endpoint):
+        """Return the cache TTL for an endpoint, or None if uncacheable"""
+        for prefix, ttl in self.CACHE_TTLS.items():
+            if endpoint.startswith(prefix):
+                return ttl
+        return None
+
     def get(self, endpoint):
+        ttl = self._ttl_for(endpoint)
+        if ttl is not None:
+            entry = self._cache.get(endpoint)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return entry[1]
         try:
-            response = requests.get(f"{self.base_url}{endpoint}", timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
+            conditional = self._etags.get(endpoint)
+            headers = {'If-None-Match': conditional[0]} if conditional else None
+            response = self.session.get(
+                self._url(endpoint), headers=headers, timeout=self.timeout
+            )
+            if response.status_code == 304:
+                data = conditional[1]
+                if ttl is not None:
+                    self._cache[endpoint] = (time.monotonic(), data)
+                return data
+            if not response.ok:
+                return {'error': f'HTTP {response.status_code}', 'status': response.status_code}
+            data = orjson.loads(response.content)
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etags[endpoint] = (etag, data)
+            if ttl is not None:
+                self._cache[endpoint] = (time.monotonic(), data)
+                if len(self._cache) > self.CACHE_MAX_ENTRIES:
+                    oldest = min(self._cache, key=lambda k: self._cache[k][0])
+                    del self._cache[oldest]
+            return data
         except requests.exceptions.RequestException as e:
             return {'error': str(e)}
-    
+
+    def stream(self, endpoint):
+        """GET a JSON array response as a lazy iterator of items"""
+        try:
+            response = self.session.get(self._url(endpoint), timeout=self.timeout, stream=True)
+            if not response.ok:
+                return {'error': f'HTTP {response.status_code}', 'status': response.status_code}
+            response.raw.decode_content = True
+            return ijson.items(response.raw, 'item')
+        except requests.exceptions.RequestException as e:
+            return {'error': str(e)}
+
     def post(self, endpoint, data):
         try:
-            response = requests.post(f"{self.base_url}{endpoint}", json=data, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
+            response = self.session.post(
+                self._url(endpoint), data=orjson.dumps(data),
+                headers={'Content-Type': 'application/json'}, timeout=self.timeout
+            )
+            if not response.ok:
+                return {'error': f'HTTP {response.status_code}', 'status': response.status_code}
+            self._evict(endpoint)
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             return {'error': str(e)}
-    
+
     def put(self, endpoint, data):
         try:
-            response = requests.put(f"{self.base_url}{endpoint}", json=data, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
+            response = self.session.put(
+                self._url(endpoint), data=orjson.dumps(data),
+                headers={'Content-Type': 'application/json'}, timeout=self.timeout
+            )
+            if not response.ok:
+                return {'error': f'HTTP {response.status_code}', 'status': response.status_code}
+            self._evict(endpoint)
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             return {'error': str(e)}
-    
+
     def delete(self, endpoint):
         try:
-            response = requests.delete(f"{self.base_url}{endpoint}", timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
+            response = self.session.delete(self._url(endpoint), timeout=self.timeout)
+            if not response.ok:
+                return {'error': f'HTTP {response.status_code}', 'status': response.status_code}
+            self._evict(endpoint)
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             return {'error': str(e)}
 
@@ -82,6 +220,25 @@ class ModernEntry(ctk.CTkEntry):
         )
 
 
+class _Toast(ctk.CTkFrame):
+    """Non-blocking corner notification that auto-dismisses itself"""
+
+    COLORS = {'success': '#10b981', 'error': '#ef4444'}
+
+    def __init__(self, master, text, kind='success', duration=2500):
+        super().__init__(master, fg_color=self.COLORS.get(kind, '#3b82f6'), corner_radius=10)
+        ctk.CTkLabel(
+            self,
+            text=text,
+            font=ctk.CTkFont(size=12, weight="bold"),
+            text_color="white",
+            wraplength=360,
+            justify="left"
+        ).pack(padx=15, pady=10)
+        self.place(relx=0.99, rely=0.97, anchor="se")
+        self.after(duration, self.destroy)
+
+
 class RoleSelectionWindow:
     def __init__(self):
         self.selected_role = None
@@ -358,26 +515,28 @@ class LoginWindow:
         self.login_button.configure(state="disabled", text="Logging in...")
         self.error_label.configure(text="")
         
-        def do_login():
-            data = {
-                "username": username,
-                "password": password
-            }
-            result = self.api.post("/auth/login", data)
-            
-            if 'error' in result:
-                self.window.after(0, lambda: self.show_error(f"Connection error: {result['error']}"))
-                self.window.after(0, lambda: self.login_button.configure(state="normal", text="Login"))
-            elif result.get('success'):
-                self.user_data = result.get('user')
-                self.login_successful = True
-                self.window.after(0, self.window.destroy)
-            else:
-                self.window.after(0, lambda: self.show_error(result.get('message', 'Login failed')))
-                self.window.after(0, lambda: self.login_button.configure(state="normal", text="Login"))
-        
-        threading.Thread(target=do_login, daemon=True).start()
-        
+        data = {
+            "username": username,
+            "password": password
+        }
+        future = _IO_EXECUTOR.submit(self.api.post, "/auth/login", data)
+        future.add_done_callback(
+            lambda f: self.window.after(0, self._on_login_done, f))
+
+    def _on_login_done(self, future):
+        """Apply the login result on the Tk thread in a single callback"""
+        result = future.result()
+        if 'error' in result:
+            self.show_error(f"Connection error: {result['error']}")
+            self.login_button.configure(state="normal", text="Login")
+        elif result.get('success'):
+            self.user_data = result.get('user')
+            self.login_successful = True
+            self.window.destroy()
+        else:
+            self.show_error(result.get('message', 'Login failed'))
+            self.login_button.configure(state="normal", text="Login")
+
     def show_error(self, message):
         """Show error message"""
         self.error_label.configure(text=message)
@@ -823,11 +982,8 @@ class MenuWindow:
         
     def adjust_color_brightness(self, hex_color, factor):
         """Adjust color brightness for hover effect"""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        new_rgb = tuple(int(c * factor) for c in rgb)
-        return f"#{new_rgb[0]:02x}{new_rgb[1]:02x}{new_rgb[2]:02x}"
-        
+        return _adjust_brightness(hex_color, factor)
+
     def open_feature(self, feature):
         """Open selected feature"""
         self.selected_feature = feature
@@ -846,12 +1002,56 @@ class MenuWindow:
 
 class EduCoreApp:
     """Main application class"""
-    
+
+    # Placeholder texts the subject combobox shows before a real selection
+    _PLACEHOLDERS = frozenset({
+        "Enter student code first...",
+        "Select a subject code...",
+        "No subjects available",
+    })
+
+    # Valid grades: 1.00-4.99 in up to two decimals, or exactly 5.0
+    _GRADE_RE = re.compile(r'^[1-4](?:\.\d{1,2})?$|^5(?:\.0{1,2})?$')
+
+    # Rows shown in the GWA report before the user opts into the full list
+    GWA_ROW_CAP = 500
+
     def __init__(self, user_data=None, initial_tab=None):
         self.api = APIClient()
         self.user_data = user_data or {}
         self.root = ctk.CTk()
         self.root.geometry("1400x850")
+
+        # Fonts registered once with Tk and shared by every widget in this
+        # window (each inline CTkFont call registers a new Tk font object)
+        self.fonts = {
+            'tiny': ctk.CTkFont(size=9),
+            'small': ctk.CTkFont(size=10),
+            'caption': ctk.CTkFont(size=11),
+            'label': ctk.CTkFont(size=12),
+            'body': ctk.CTkFont(size=13),
+            'body_lg': ctk.CTkFont(size=14),
+            'label_bold': ctk.CTkFont(size=12, weight="bold"),
+            'body_bold': ctk.CTkFont(size=13, weight="bold"),
+            'h4': ctk.CTkFont(size=14, weight="bold"),
+            'h3': ctk.CTkFont(size=16, weight="bold"),
+            'h2': ctk.CTkFont(size=18, weight="bold"),
+            'h1': ctk.CTkFont(size=20, weight="bold"),
+            'stat': ctk.CTkFont(size=28, weight="bold"),
+            'title': ctk.CTkFont(size=32, weight="bold"),
+        }
+
+        # Shared worker pool for all background API calls (cheaper than
+        # spawning a thread per click and bounds in-flight requests)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="educore-io"
+        )
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Virtual events let workers signal common success flows with one
+        # thread-safe event_generate instead of several after(0, lambda) closures
+        self.root.bind("<<GradeAdded>>", self._on_grade_added)
+        self.root.bind("<<StudentUpdated>>", self._on_student_updated)
         
         # Update title with user info
         user_name = self.user_data.get('full_name', 'User')
@@ -861,13 +1061,56 @@ class EduCoreApp:
         # QR Code directory
         self.qr_code_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "qr_codes")
         os.makedirs(self.qr_code_dir, exist_ok=True)
+
+        # Rendered QR PhotoImages keyed by student code; repeat views skip
+        # the disk read and LANCZOS resample
+        self._qr_cache = {}
         
         # Initialize data storage
         self.students = []
         self.courses = []
+        # O(1) lookup indices, rebuilt whenever the lists refresh
+        self._students_by_code = {}
+        self._courses_by_code = {}
         self.current_student_grades = []
         self.initial_tab = initial_tab
-        
+
+        # Short-lived cache for student metadata lookups (code -> (timestamp, data))
+        self._student_cache = {}
+        self._student_cache_ttl = 10  # seconds
+
+        # Single-flight guards: repeated refresh clicks share the in-flight fetch
+        self._gwa_inflight = None
+        self._students_inflight = None
+
+        # Debounce token so only the latest subject-load request wins
+        self._subj_token = 0
+
+        # Fingerprint of the last rendered students list; redundant
+        # refreshes skip the tree rebuild entirely
+        self._students_fingerprint = None
+
+        # Whether the GWA report shows every row or just the GWA_ROW_CAP
+        # best performers
+        self._gwa_show_all = False
+
+        # Debounce timer and in-flight future for analytics refreshes
+        self._analytics_after_id = None
+        self._analytics_inflight = None
+
+        # Pending debounce timer for refresh_students
+        self._students_refresh_job = None
+
+        # Maps student_code -> treeview iid for in-place row updates
+        self._students_tree_index = {}
+
+        # Fingerprint of the last rendered course catalog; unchanged
+        # payloads skip the tree rebuild
+        self._courses_fingerprint = None
+
+        # Course node iid -> subjects awaiting lazy insertion on expand
+        self._pending_subjects = {}
+
         # Color scheme - Modern palette
         self.colors = {
             'primary': '#6366f1',
@@ -884,12 +1127,47 @@ class EduCoreApp:
         }
         
         self.setup_ui()
-        self.load_initial_data()
-    
+
+    def _submit(self, fn):
+        """Run a task on the shared worker pool"""
+        future = self._executor.submit(fn)
+        future.add_done_callback(self._on_task_done)
+        return future
+
+    def _on_task_done(self, future):
+        """Route uncaught worker exceptions back to the UI thread"""
+        exc = future.exception()
+        if exc is not None:
+            try:
+                self.root.after(0, lambda: self.show_error("Background Task Error", str(exc)))
+            except tk.TclError:
+                pass  # Window already closed
+
+    def _on_close(self):
+        """Shut down the worker pool, close connections and the window"""
+        self._executor.shutdown(wait=False)
+        self.api.close()
+        self.root.destroy()
+
+    def _on_grade_added(self, event=None):
+        """Success flow after a grade is submitted"""
+        self.show_success("Grade added successfully")
+        self.clear_grade_form()
+        self.refresh_students()
+
+    def _on_student_updated(self, event=None):
+        """Success flow after a student's course is updated"""
+        self.show_success("Student course updated successfully")
+        self.update_code_entry.delete(0, 'end')
+        self.refresh_students()
+
     def setup_ui(self):
         """Setup the main user interface"""
         # Header
         self.create_header()
+
+        # One-shot global treeview styling shared by every tree
+        self._configure_treeview_style()
         
         # Main content area
         self.main_container = ctk.CTkFrame(self.root, fg_color="transparent")
@@ -910,14 +1188,14 @@ class EduCoreApp:
         title = ctk.CTkLabel(
             title_frame,
             text="🎓 EduCore",
-            font=ctk.CTkFont(size=32, weight="bold")
+            font=self.fonts['title']
         )
         title.pack(anchor="w")
         
         subtitle = ctk.CTkLabel(
             title_frame,
             text="Academic Management System - Student, Course & Grade Management",
-            font=ctk.CTkFont(size=13),
+            font=self.fonts['body'],
             text_color="#6b7280"
         )
         subtitle.pack(anchor="w")
@@ -934,7 +1212,7 @@ class EduCoreApp:
             width=120,
             height=35,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.fonts['label_bold'],
             fg_color=self.colors['primary'],
             hover_color=self.colors['primary_dark']
         ).pack(side="right", padx=(0, 10))
@@ -943,17 +1221,13 @@ class EduCoreApp:
         self.status_label = ctk.CTkLabel(
             right_frame,
             text="● Connected",
-            font=ctk.CTkFont(size=12),
+            font=self.fonts['label'],
             text_color=self.colors['success']
         )
         self.status_label.pack(side="right", padx=(0, 10))
     
-    def create_tabview(self):
-        """Create main tabview"""
-        self.tabview = ctk.CTkTabview(self.main_container, corner_radius=10)
-        self.tabview.pack(fill="both", expand=True)
-        
-        # Configure global treeview style for light theme
+    def _configure_treeview_style(self):
+        """Configure the global treeview style for the light theme"""
         self.style = ttk.Style()
         self.style.theme_use("clam")
         self.style.configure("Treeview",
@@ -970,44 +1244,82 @@ class EduCoreApp:
                             borderwidth=0,
                             relief="flat",
                             font=('Segoe UI', 11, 'bold'))
-        self.style.map('Treeview', 
+        self.style.map('Treeview',
                       background=[('selected', '#e0e7ff')],
                       foreground=[('selected', '#4f46e5')])
-        
+
+    def create_tabview(self):
+        """Create main tabview"""
+        self.tabview = ctk.CTkTabview(self.main_container, corner_radius=10)
+        self.tabview.pack(fill="both", expand=True)
+
         # Add tabs
         self.tabview.add("Students")
         self.tabview.add("Grades")
         self.tabview.add("Reports")
         self.tabview.add("Analytics")
         self.tabview.add("Courses")
-        
-        # Setup each tab
-        self.create_students_tab()
-        self.create_grades_tab()
-        self.create_reports_tab()
-        self.create_analytics_tab()
-        self.create_courses_tab()
-        
-        # Set initial tab if specified
+
+        # Tab contents are built lazily on first visit - startup only pays
+        # for the tab the user actually lands on
+        self._tab_builders = {
+            "Students": self.create_students_tab,
+            "Grades": self.create_grades_tab,
+            "Reports": self.create_reports_tab,
+            "Analytics": self.create_analytics_tab,
+            "Courses": self.create_courses_tab,
+        }
+        self._tab_loaders = {
+            "Students": self._load_students_tab_data,
+            "Reports": self.refresh_gwa_report,
+            "Analytics": self.refresh_analytics,
+            "Courses": self.load_courses,
+        }
+        self._tab_built = set()
+
+        # Build only the initially visible tab
         if self.initial_tab:
             self.tabview.set(self.initial_tab)
-            # Auto-load analytics if that's the initial tab
-            if self.initial_tab == "Analytics":
-                self.root.after(100, self.refresh_analytics)
-        
-        # Store original command and wrap it to auto-load analytics
+        self._ensure_tab(self.tabview.get())
+
+        # Store original command and wrap it to build/refresh on switch
         self._original_tab_command = self.tabview._segmented_button.cget("command")
         self.tabview._segmented_button.configure(command=self._on_tab_change)
-    
+
+    def _ensure_tab(self, tab_name):
+        """Build a tab's contents and load its data on first visit"""
+        if tab_name in self._tab_built:
+            return
+        self._tab_built.add(tab_name)
+        self._tab_builders[tab_name]()
+        loader = self._tab_loaders.get(tab_name)
+        if loader:
+            loader()
+
     def _on_tab_change(self, tab_name):
         """Handle tab change events"""
         # Call the original command to actually change the tab
         if self._original_tab_command:
             self._original_tab_command(tab_name)
-        
-        # Auto-refresh analytics when switching to it
-        if tab_name == "Analytics":
-            self.root.after(100, self.refresh_analytics)
+
+        if tab_name not in self._tab_built:
+            self._ensure_tab(tab_name)
+        elif tab_name == "Analytics":
+            # Auto-refresh analytics when switching back to it, debounced
+            # so rapid tab flipping coalesces into one fetch
+            if self._analytics_after_id is not None:
+                self.root.after_cancel(self._analytics_after_id)
+            self._analytics_after_id = self.root.after(150, self._do_refresh_analytics)
+
+    def _do_refresh_analytics(self):
+        """Fire the debounced analytics refresh"""
+        self._analytics_after_id = None
+        self.refresh_analytics()
+
+    def _load_students_tab_data(self):
+        """Initial data for the Students tab (dropdowns + list)"""
+        self.load_courses()
+        self.refresh_students()
     
     def create_students_tab(self):
         """Create students management tab"""
@@ -1025,11 +1337,11 @@ class EduCoreApp:
         ctk.CTkLabel(
             add_section,
             text="➕ Add New Student",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.fonts['h2']
         ).pack(pady=(10, 15))
         
         # Student Code
-        ctk.CTkLabel(add_section, text="Student Code", font=ctk.CTkFont(size=12)).pack(anchor="w", padx=10)
+        ctk.CTkLabel(add_section, text="Student Code", font=self.fonts['label']).pack(anchor="w", padx=10)
         self.student_code_entry = ModernEntry(
             add_section,
             placeholder_text="e.g., 24-49051"
@@ -1037,7 +1349,7 @@ class EduCoreApp:
         self.student_code_entry.pack(fill="x", padx=10, pady=(5, 10))
         
         # Name
-        ctk.CTkLabel(add_section, text="Full Name", font=ctk.CTkFont(size=12)).pack(anchor="w", padx=10)
+        ctk.CTkLabel(add_section, text="Full Name", font=self.fonts['label']).pack(anchor="w", padx=10)
         self.name_entry = ModernEntry(
             add_section,
             placeholder_text="Enter student full name"
@@ -1045,13 +1357,13 @@ class EduCoreApp:
         self.name_entry.pack(fill="x", padx=10, pady=(5, 10))
         
         # Course
-        ctk.CTkLabel(add_section, text="Course", font=ctk.CTkFont(size=12)).pack(anchor="w", padx=10)
+        ctk.CTkLabel(add_section, text="Course", font=self.fonts['label']).pack(anchor="w", padx=10)
         self.course_var = tk.StringVar(value="BSIT")
         self.course_dropdown = ctk.CTkComboBox(
             add_section,
             variable=self.course_var,
             values=["BSIT", "BSCS", "BSBA"],
-            font=ctk.CTkFont(size=12),
+            font=self.fonts['label'],
             corner_radius=10,
             border_width=2,
             border_color="#e5e7eb",
@@ -1077,23 +1389,23 @@ class EduCoreApp:
         ctk.CTkLabel(
             update_section,
             text="✏️ Update Student Course",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.fonts['h2']
         ).pack(pady=(10, 15))
         
-        ctk.CTkLabel(update_section, text="Student Code", font=ctk.CTkFont(size=12)).pack(anchor="w", padx=10)
+        ctk.CTkLabel(update_section, text="Student Code", font=self.fonts['label']).pack(anchor="w", padx=10)
         self.update_code_entry = ModernEntry(
             update_section,
             placeholder_text="Enter student code"
         )
         self.update_code_entry.pack(fill="x", padx=10, pady=(5, 10))
         
-        ctk.CTkLabel(update_section, text="New Course", font=ctk.CTkFont(size=12)).pack(anchor="w", padx=10)
+        ctk.CTkLabel(update_section, text="New Course", font=self.fonts['label']).pack(anchor="w", padx=10)
         self.update_course_var = tk.StringVar(value="BSIT")
         self.update_course_dropdown = ctk.CTkComboBox(
             update_section,
             variable=self.update_course_var,
             values=["BSIT", "BSCS", "BSBA"],
-            font=ctk.CTkFont(size=12),
+            font=self.fonts['label'],
             corner_radius=10,
             border_width=2,
             border_color="#e5e7eb",
@@ -1122,7 +1434,7 @@ class EduCoreApp:
         ctk.CTkLabel(
             header_frame,
             text="Students List",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.fonts['h2']
         ).pack(side="left")
         
         ModernButton(
@@ -1176,7 +1488,13 @@ class EduCoreApp:
         self.students_tree.column("Course", width=100, anchor="center")
         self.students_tree.column("GWA", width=80, anchor="center")
         self.students_tree.column("Status", width=150, anchor="center")
-        
+
+        # Color rows by performance bucket; configured once, applied per
+        # row via tags so the update loop does no extra styling work
+        for tag, color in (('excellent', '#10b981'), ('good', '#f59e0b'),
+                           ('fail', '#ef4444'), ('na', '#6b7280')):
+            self.students_tree.tag_configure(tag, foreground=color)
+
         # Scrollbars
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.students_tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.students_tree.xview)
@@ -1205,15 +1523,15 @@ class EduCoreApp:
         ctk.CTkLabel(
             add_section,
             text="➕ Add/Update Grade",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.fonts['h2']
         ).pack(pady=(10, 15))
         
         # Student Code
         student_code_label_frame = ctk.CTkFrame(add_section, fg_color="transparent")
         student_code_label_frame.pack(fill="x", padx=10, anchor="w")
-        ctk.CTkLabel(student_code_label_frame, text="Student Code", font=ctk.CTkFont(size=12)).pack(side="left")
+        ctk.CTkLabel(student_code_label_frame, text="Student Code", font=self.fonts['label']).pack(side="left")
         ctk.CTkLabel(student_code_label_frame, text="(Press Enter to load subjects)", 
-                    font=ctk.CTkFont(size=9), text_color="gray60").pack(side="left", padx=(5, 0))
+                    font=self.fonts['tiny'], text_color="gray60").pack(side="left", padx=(5, 0))
         
         self.grade_student_code_entry = ModernEntry(
             add_section,
@@ -1225,17 +1543,17 @@ class EduCoreApp:
         # Subject Code (with autocomplete dropdown)
         subject_label_frame = ctk.CTkFrame(add_section, fg_color="transparent")
         subject_label_frame.pack(fill="x", padx=10, anchor="w")
-        ctk.CTkLabel(subject_label_frame, text="Subject Code", font=ctk.CTkFont(size=12)).pack(side="left")
+        ctk.CTkLabel(subject_label_frame, text="Subject Code", font=self.fonts['label']).pack(side="left")
         ctk.CTkLabel(subject_label_frame, text="(Select from dropdown)", 
-                    font=ctk.CTkFont(size=9), text_color="gray60").pack(side="left", padx=(5, 0))
+                    font=self.fonts['tiny'], text_color="gray60").pack(side="left", padx=(5, 0))
         
         self.subject_code_combobox = ctk.CTkComboBox(
             add_section,
             values=["Enter student code first..."],
             command=self.on_subject_selected,
             state="readonly",
-            font=ctk.CTkFont(size=12),
-            dropdown_font=ctk.CTkFont(size=11),
+            font=self.fonts['label'],
+            dropdown_font=self.fonts['caption'],
             height=35,
             corner_radius=10,
             border_width=2,
@@ -1250,7 +1568,7 @@ class EduCoreApp:
         self.subjects_data = {}
         
         # Subject Name (auto-filled, read-only)
-        ctk.CTkLabel(add_section, text="Subject Name", font=ctk.CTkFont(size=12)).pack(anchor="w", padx=10)
+        ctk.CTkLabel(add_section, text="Subject Name", font=self.fonts['label']).pack(anchor="w", padx=10)
         self.subject_name_entry = ModernEntry(
             add_section,
             placeholder_text="Auto-filled when subject is selected"
@@ -1259,7 +1577,7 @@ class EduCoreApp:
         self.subject_name_entry.configure(state="disabled")  # Make it read-only
         
         # Grade
-        ctk.CTkLabel(add_section, text="Grade (1.0 - 5.0)", font=ctk.CTkFont(size=12)).pack(anchor="w", padx=10)
+        ctk.CTkLabel(add_section, text="Grade (1.0 - 5.0)", font=self.fonts['label']).pack(anchor="w", padx=10)
         self.grade_entry = ModernEntry(
             add_section,
             placeholder_text="e.g., 1.25"
@@ -1282,7 +1600,7 @@ Grade Scale:
         ctk.CTkLabel(
             info_frame,
             text=grade_info,
-            font=ctk.CTkFont(size=10),
+            font=self.fonts['small'],
             justify="left",
             text_color="#4b5563"
         ).pack(padx=10, pady=10, anchor="w")
@@ -1308,7 +1626,7 @@ Grade Scale:
         ctk.CTkLabel(
             header_frame,
             text="Student Grades",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.fonts['h2']
         ).pack(side="left")
         
         # Search frame
@@ -1318,7 +1636,7 @@ Grade Scale:
         ctk.CTkLabel(
             search_frame,
             text="Enter Student Code:",
-            font=ctk.CTkFont(size=12)
+            font=self.fonts['label']
         ).pack(side="left", padx=(0, 10))
         
         self.view_student_code_entry = ModernEntry(
@@ -1353,7 +1671,7 @@ Grade Scale:
         self.student_info_label = ctk.CTkLabel(
             self.grades_info_frame,
             text="Select a student to view grades",
-            font=ctk.CTkFont(size=13),
+            font=self.fonts['body'],
             text_color="#6b7280"
         )
         self.student_info_label.pack(pady=10)
@@ -1401,7 +1719,7 @@ Grade Scale:
         ctk.CTkLabel(
             header_frame,
             text="General Weighted Average (GWA) Report",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self.fonts['h1']
         ).pack(side="left")
         
         ModernButton(
@@ -1411,7 +1729,17 @@ Grade Scale:
             width=150,
             height=35
         ).pack(side="right")
-        
+
+        self.gwa_show_all_button = ModernButton(
+            header_frame,
+            text="Show All",
+            command=self._toggle_gwa_show_all,
+            width=110,
+            height=35,
+            fg_color="gray50"
+        )
+        self.gwa_show_all_button.pack(side="right", padx=(0, 10))
+
         # Statistics frame
         stats_frame = ctk.CTkFrame(tab)
         stats_frame.pack(fill="x", padx=15, pady=(0, 15))
@@ -1471,7 +1799,26 @@ Grade Scale:
     
     def create_analytics_tab(self):
         """Create analytics dashboard tab with charts"""
+        # matplotlib is imported lazily so cold start only pays for it if
+        # the Analytics tab is actually opened (the tab itself is lazy too)
+        import matplotlib
+        matplotlib.use('TkAgg')
+        import matplotlib.pyplot as plt
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         tab = self.tabview.tab("Analytics")
+
+        # Tune matplotlib once for the small embedded charts: simplified
+        # paths, fixed DPI and no automatic re-layout on every draw
+        plt.rcParams.update({
+            'figure.dpi': 80,
+            'path.simplify': True,
+            'path.simplify_threshold': 1.0,
+            'agg.path.chunksize': 10000,
+            'figure.autolayout': False,
+            'axes.grid': False,
+        })
         
         # Header
         header_frame = ctk.CTkFrame(tab, fg_color="transparent")
@@ -1480,7 +1827,7 @@ Grade Scale:
         ctk.CTkLabel(
             header_frame,
             text="Analytics Dashboard",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self.fonts['h1']
         ).pack(side="left")
         
         ModernButton(
@@ -1512,14 +1859,23 @@ Grade Scale:
         # Create window in canvas
         self.analytics_window = self.analytics_canvas.create_window((0, 0), window=self.analytics_content, anchor="nw")
         
-        # Bind configuration events
-        self.analytics_content.bind("<Configure>", lambda e: self.analytics_canvas.configure(scrollregion=self.analytics_canvas.bbox("all")))
+        # Bind configuration events; the scrollregion recompute walks every
+        # child (bbox("all")), so coalesce bursts of resizes behind a short
+        # timer and skip the configure when the bbox hasn't moved
+        self._scrollregion_job = None
+        self._last_scrollregion = None
+        self.analytics_content.bind("<Configure>", self._schedule_scrollregion_update)
         self.analytics_canvas.bind("<Configure>", lambda e: self.analytics_canvas.itemconfig(self.analytics_window, width=e.width))
-        
-        # Bind mouse wheel for smooth scrolling
+
+        # Bind mouse wheel for smooth scrolling. The global binding is only
+        # active while the pointer is over the canvas, so wheel events in
+        # other tabs don't dispatch through (or scroll) this handler
         def _on_mousewheel(event):
             self.analytics_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        self.analytics_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        self.analytics_canvas.bind(
+            "<Enter>", lambda e: self.analytics_canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        self.analytics_canvas.bind(
+            "<Leave>", lambda e: self.analytics_canvas.unbind_all("<MouseWheel>"))
         
         # Statistics Overview
         stats_frame = ctk.CTkFrame(self.analytics_content)
@@ -1528,7 +1884,7 @@ Grade Scale:
         ctk.CTkLabel(
             stats_frame,
             text="📊 Overview Statistics",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.fonts['h3']
         ).pack(anchor="w", padx=15, pady=(15, 10))
         
         stats_container = ctk.CTkFrame(stats_frame, fg_color="transparent")
@@ -1571,11 +1927,15 @@ Grade Scale:
         ctk.CTkLabel(
             course_chart_frame,
             text="Students per Course",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.fonts['h4']
         ).pack(pady=(10, 5))
         
-        self.course_chart_label = ctk.CTkLabel(course_chart_frame, text="")
-        self.course_chart_label.pack(fill="both", expand=True, padx=10, pady=10)
+        # Persistent figure embedded directly as a Tk widget - cleared and
+        # redrawn in place on refresh, no PNG encode/decode round-trip
+        self._course_fig = Figure(figsize=(5, 3.5), dpi=80, facecolor='white')
+        self._course_ax = self._course_fig.add_subplot(111)
+        self._course_canvas = FigureCanvasTkAgg(self._course_fig, master=course_chart_frame)
+        self._course_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
         
         # Grade Distribution Chart (right)
         grade_chart_frame = ctk.CTkFrame(top_row, width=400, height=300)
@@ -1585,11 +1945,16 @@ Grade Scale:
         ctk.CTkLabel(
             grade_chart_frame,
             text="Grade Distribution",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.fonts['h4']
         ).pack(pady=(10, 5))
         
-        self.grade_chart_label = ctk.CTkLabel(grade_chart_frame, text="")
-        self.grade_chart_label.pack(fill="both", expand=True, padx=10, pady=10)
+        self._grade_fig = Figure(figsize=(5, 3.5), dpi=80, facecolor='white')
+        # Fixed margins set once; tight_layout's iterative solver is too
+        # expensive to re-run on every refresh
+        self._grade_fig.subplots_adjust(left=0.12, right=0.97, top=0.92, bottom=0.28)
+        self._grade_ax = self._grade_fig.add_subplot(111)
+        self._grade_canvas = FigureCanvasTkAgg(self._grade_fig, master=grade_chart_frame)
+        self._grade_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
         
         # Bottom row - Course Performance Chart
         bottom_row = ctk.CTkFrame(charts_frame, fg_color="transparent")
@@ -1602,11 +1967,14 @@ Grade Scale:
         ctk.CTkLabel(
             performance_chart_frame,
             text="Average GWA per Course",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.fonts['h4']
         ).pack(pady=(10, 5))
         
-        self.performance_chart_label = ctk.CTkLabel(performance_chart_frame, text="")
-        self.performance_chart_label.pack(fill="both", expand=True, padx=10, pady=10)
+        self._perf_fig = Figure(figsize=(7, 3.5), dpi=80, facecolor='white')
+        self._perf_fig.subplots_adjust(left=0.09, right=0.98, top=0.92, bottom=0.12)
+        self._perf_ax = self._perf_fig.add_subplot(111)
+        self._perf_canvas = FigureCanvasTkAgg(self._perf_fig, master=performance_chart_frame)
+        self._perf_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
         
         # Top Performers List
         top_performers_frame = ctk.CTkFrame(self.analytics_content)
@@ -1615,7 +1983,7 @@ Grade Scale:
         ctk.CTkLabel(
             top_performers_frame,
             text="🏆 Top 10 Performers (GWA ≤ 1.75)",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.fonts['h3']
         ).pack(anchor="w", padx=15, pady=(15, 10))
         
         # Treeview for top performers
@@ -1658,7 +2026,7 @@ Grade Scale:
         ctk.CTkLabel(
             header_frame,
             text="Available Courses & Subjects",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self.fonts['h1']
         ).pack(side="left")
         
         ModernButton(
@@ -1669,10 +2037,45 @@ Grade Scale:
             height=35
         ).pack(side="right")
         
-        # Scrollable frame for courses
-        self.courses_scroll = ctk.CTkScrollableFrame(tab)
-        self.courses_scroll.pack(fill="both", expand=True, padx=15, pady=(0, 15))
-    
+        # One hierarchical treeview instead of a frame/label per course and
+        # subject - CTk widgets are canvas-backed and far heavier per row
+        tree_frame = ctk.CTkFrame(tab)
+        tree_frame.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+
+        self.courses_tree = ttk.Treeview(
+            tree_frame,
+            columns=("Name",),
+            show="tree headings",
+            height=15
+        )
+        self.courses_tree.heading("#0", text="Code")
+        self.courses_tree.heading("Name", text="Name")
+        self.courses_tree.column("#0", width=220)
+        self.courses_tree.column("Name", width=500)
+
+        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.courses_tree.yview)
+        self.courses_tree.configure(yscrollcommand=vsb.set)
+
+        self.courses_tree.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=10)
+        vsb.pack(side="right", fill="y", pady=10)
+
+        # Subject rows are inserted lazily when a course node is expanded
+        self.courses_tree.bind("<<TreeviewOpen>>", self._on_course_open)
+    
+    def _schedule_scrollregion_update(self, event=None):
+        """Debounce analytics scrollregion recomputes during resize bursts"""
+        if self._scrollregion_job is not None:
+            self.root.after_cancel(self._scrollregion_job)
+        self._scrollregion_job = self.root.after(50, self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        """Recompute the analytics canvas scrollregion if it moved"""
+        self._scrollregion_job = None
+        bbox = self.analytics_canvas.bbox("all")
+        if bbox != self._last_scrollregion:
+            self._last_scrollregion = bbox
+            self.analytics_canvas.configure(scrollregion=bbox)
+
     def create_stat_box(self, parent, title, value, color):
         """Create a statistics box"""
         box = ctk.CTkFrame(parent, fg_color=color)
@@ -1680,14 +2083,14 @@ Grade Scale:
         ctk.CTkLabel(
             box,
             text=title,
-            font=ctk.CTkFont(size=12),
+            font=self.fonts['label'],
             text_color="white"
         ).pack(pady=(15, 5))
         
         value_label = ctk.CTkLabel(
             box,
             text=value,
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=self.fonts['stat'],
             text_color="white"
         )
         value_label.pack(pady=(0, 15))
@@ -1698,34 +2101,24 @@ Grade Scale:
     
     # ==================== Data Loading Methods ====================
     
-    def load_initial_data(self):
-        """Load all initial data"""
-        threading.Thread(target=self._load_initial_data, daemon=True).start()
-    
-    def _load_initial_data(self):
-        """Background thread for loading initial data"""
-        self.load_courses()
-        self.refresh_students()
-        self.refresh_gwa_report()
-        # Load analytics if it's the initial tab
-        if self.initial_tab == "Analytics":
-            self.refresh_analytics()
-    
     def load_courses(self):
         """Load courses from API"""
         def load():
             result = self.api.get("/courses")
             if 'error' not in result:
                 self.courses = result
+                self._courses_by_code = {c['code']: c for c in result}
                 self.root.after(0, self.update_course_dropdowns)
                 self.root.after(0, self.display_courses)
             else:
                 self.root.after(0, lambda: self.show_error("Failed to load courses", result['error']))
-        
-        threading.Thread(target=load, daemon=True).start()
+
+        self._submit(load)
     
     def update_course_dropdowns(self):
         """Update course dropdown menus"""
+        if "Students" not in self._tab_built:
+            return
         if self.courses:
             course_codes = [course['code'] for course in self.courses]
             self.course_dropdown.configure(values=course_codes)
@@ -1733,57 +2126,58 @@ Grade Scale:
     
     def display_courses(self):
         """Display courses and their subjects"""
-        # Clear existing widgets
-        for widget in self.courses_scroll.winfo_children():
-            widget.destroy()
-        
+        if "Courses" not in self._tab_built:
+            return
+        # Skip the rebuild entirely when the course list hasn't changed
+        fingerprint = hash(repr(self.courses))
+        if fingerprint == self._courses_fingerprint:
+            return
+        self._courses_fingerprint = fingerprint
+
+        tree = self.courses_tree
+        tree.delete(*tree.get_children())
+        self._pending_subjects = {}
         for course in self.courses:
-            # Course frame
-            course_frame = ctk.CTkFrame(self.courses_scroll)
-            course_frame.pack(fill="x", pady=10, padx=10)
-            
-            # Course header
-            header = ctk.CTkFrame(course_frame, fg_color=(self.colors['primary'], self.colors['primary']))
-            header.pack(fill="x", padx=0, pady=0)
-            
-            ctk.CTkLabel(
-                header,
-                text=f"{course['code']} - {course['name']}",
-                font=ctk.CTkFont(size=16, weight="bold"),
-                text_color="white"
-            ).pack(pady=15, padx=20, anchor="w")
-            
-            # Subjects list
-            if course.get('subjects'):
-                subjects_frame = ctk.CTkFrame(course_frame, fg_color="transparent")
-                subjects_frame.pack(fill="x", padx=20, pady=15)
-                
-                ctk.CTkLabel(
-                    subjects_frame,
-                    text="Subjects:",
-                    font=ctk.CTkFont(size=13, weight="bold")
-                ).pack(anchor="w", pady=(0, 10))
-                
-                for subject in course['subjects']:
-                    subject_item = ctk.CTkFrame(subjects_frame, fg_color=("#f9fafb", "#f9fafb"))
-                    subject_item.pack(fill="x", pady=2)
-                    
-                    ctk.CTkLabel(
-                        subject_item,
-                        text=f"• {subject['subject_code']} - {subject['subject_name']}",
-                        font=ctk.CTkFont(size=12),
-                        anchor="w"
-                    ).pack(pady=8, padx=15, anchor="w")
-            else:
-                ctk.CTkLabel(
-                    course_frame,
-                    text="No subjects defined",
-                    font=ctk.CTkFont(size=12),
-                    text_color="gray70"
-                ).pack(pady=10)
+            parent = tree.insert(
+                "", "end", text=course['code'], values=(course['name'],), open=False
+            )
+            subjects = course.get('subjects')
+            if subjects:
+                # Placeholder child so the expander shows; real subject rows
+                # are inserted on first open
+                tree.insert(parent, "end", text="…")
+                self._pending_subjects[parent] = subjects
+
+    def _on_course_open(self, event):
+        """Swap a course's placeholder child for its real subject rows"""
+        tree = self.courses_tree
+        item = tree.focus()
+        subjects = self._pending_subjects.pop(item, None)
+        if subjects is None:
+            return
+        tree.delete(*tree.get_children(item))
+        for subject in subjects:
+            tree.insert(
+                item, "end",
+                text=subject['subject_code'],
+                values=(subject['subject_name'],)
+            )
     
     def refresh_students(self):
-        """Refresh students list"""
+        """Refresh students list (debounced so bursts coalesce into one fetch)"""
+        if self._students_refresh_job is not None:
+            self.root.after_cancel(self._students_refresh_job)
+        self._students_refresh_job = self.root.after(150, self._do_refresh_students)
+
+    def _do_refresh_students(self):
+        """Run the students fetch once the debounce window closes"""
+        self._students_refresh_job = None
+        if self._students_inflight is not None and not self._students_inflight.done():
+            # A fetch is mid-flight; try again shortly so the newest
+            # writes still end up on screen
+            self._students_refresh_job = self.root.after(150, self._do_refresh_students)
+            return
+
         def refresh():
             teacher_id = self.user_data.get('id')
             role = self.user_data.get('role')
@@ -1795,32 +2189,79 @@ Grade Scale:
             
             if 'error' not in result:
                 self.students = result
+                self._students_by_code = {s['student_code']: s for s in result}
                 self.root.after(0, self.update_students_tree)
             else:
                 self.root.after(0, lambda: self.show_error("Failed to load students", result['error']))
-        
-        threading.Thread(target=refresh, daemon=True).start()
+
+        self._students_inflight = self._submit(refresh)
     
+    def _bulk_fill_tree(self, tree, rows, tags=None):
+        """Repopulate a treeview with redraws suspended during the inserts"""
+        columns = tree["displaycolumns"]
+        tree.configure(displaycolumns=())
+        try:
+            tree.delete(*tree.get_children())
+            insert = tree.insert
+            if tags is None:
+                for values in rows:
+                    insert("", "end", values=values)
+            else:
+                for values, tag in zip(rows, tags):
+                    insert("", "end", values=values, tags=(tag,))
+        finally:
+            tree.configure(displaycolumns=columns)
+
     def update_students_tree(self):
         """Update the students treeview"""
-        # Clear existing items
-        for item in self.students_tree.get_children():
-            self.students_tree.delete(item)
-        
-        # Add students to tree
-        for student in self.students:
-            gwa = student.get('gwa', 0)
-            formatted_gwa = f"{gwa:.2f}" if gwa > 0 else "N/A"
-            status = self.get_grade_description(gwa)
-            
-            # Color coding based on GWA
-            self.students_tree.insert("", "end", values=(
-                student['student_code'],
-                student['name'],
-                student['course_code'],
-                formatted_gwa,
-                status
-            ))
+        if "Students" not in self._tab_built:
+            return
+        # Vectorize the GWA formatting and status lookup over the whole
+        # roster instead of branching per student; np.select evaluates the
+        # conditions in order, mirroring get_grade_description exactly
+        gwas = np.fromiter(
+            (s.get('gwa', 0) for s in self.students),
+            dtype=np.float64, count=len(self.students)
+        )
+        statuses = np.select(
+            [gwas == 0, gwas == 1.0, gwas <= 1.75, gwas <= 2.5, gwas <= 3.0],
+            ['Not yet graded', 'Excellent', 'Very Good', 'Good', 'Satisfactory'],
+            default='Failed'
+        )
+        formatted = np.where(gwas > 0, np.char.mod('%.2f', gwas), 'N/A')
+        tags = np.select(
+            [gwas == 0, gwas <= 1.75, gwas <= 3.0],
+            ['na', 'excellent', 'good'],
+            default='fail'
+        )
+
+        rows = [
+            (s['student_code'], s['name'], _intern(s['course_code']),
+             _intern(gwa), _intern(status))
+            for s, gwa, status in zip(self.students, formatted, statuses)
+        ]
+        row_tags = [_intern(t) for t in tags]
+
+        # Nothing changed since the last render - keep the tree (and the
+        # user's scroll position / selection) as is
+        fingerprint = hash(tuple(rows))
+        if fingerprint == self._students_fingerprint:
+            return
+        self._students_fingerprint = fingerprint
+
+        tree = self.students_tree
+        new_codes = [row[0] for row in rows]
+        index = self._students_tree_index
+        if list(index) == new_codes:
+            # Same students in the same order: patch changed rows in place
+            # instead of rebuilding, preserving scroll and selection
+            for code, values, tag in zip(new_codes, rows, row_tags):
+                iid = index[code]
+                if tree.item(iid, 'values') != values:
+                    tree.item(iid, values=values, tags=(tag,))
+        else:
+            self._bulk_fill_tree(tree, rows, row_tags)
+            self._students_tree_index = dict(zip(new_codes, tree.get_children()))
     
     # ==================== Student Management Methods ====================
     
@@ -1829,9 +2270,17 @@ Grade Scale:
         student_code = self.student_code_entry.get().strip()
         name = self.name_entry.get().strip()
         course = self.course_var.get()
-        
-        if not all([student_code, name, course]):
-            self.show_error("Validation Error", "Please fill in all fields")
+
+        # Collect every problem up front so the user sees one dialog, not several
+        errors = []
+        if not student_code:
+            errors.append("Student code is required")
+        if not name:
+            errors.append("Name is required")
+        if not course:
+            errors.append("Course is required")
+        if errors:
+            self.show_error("Validation Error", "\n".join(errors))
             return
         
         def add():
@@ -1846,13 +2295,17 @@ Grade Scale:
             if 'error' not in result:
                 # Generate QR code for the student
                 self.generate_qr_code(student_code, name)
-                self.root.after(0, lambda: self.show_success(f"Student added successfully!\nQR code generated for {student_code}"))
-                self.root.after(0, self.clear_student_form)
-                self.root.after(0, self.refresh_students)
+                self.root.after(0, self._on_student_added, student_code)
             else:
                 self.root.after(0, lambda: self.show_error("Failed to add student", result['error']))
-        
-        threading.Thread(target=add, daemon=True).start()
+
+        self._submit(add)
+
+    def _on_student_added(self, student_code):
+        """Apply all post-add UI updates in one Tk callback"""
+        self.show_success(f"Student added successfully!\nQR code generated for {student_code}")
+        self.clear_student_form()
+        self.refresh_students()
     
     def delete_student(self):
         """Delete selected student"""
@@ -1875,12 +2328,16 @@ Grade Scale:
             result = self.api.delete(f"/students/{student_code}")
             
             if 'error' not in result:
-                self.root.after(0, lambda: self.show_success("Student deleted successfully"))
-                self.root.after(0, self.refresh_students)
+                self.root.after(0, self._on_student_deleted)
             else:
                 self.root.after(0, lambda: self.show_error("Failed to delete student", result['error']))
-        
-        threading.Thread(target=delete, daemon=True).start()
+
+        self._submit(delete)
+
+    def _on_student_deleted(self):
+        """Apply all post-delete UI updates in one Tk callback"""
+        self.show_success("Student deleted successfully")
+        self.refresh_students()
     
     def update_student_course(self):
         """Update student's course"""
@@ -1894,15 +2351,14 @@ Grade Scale:
         def update():
             data = {'course_code': new_course}
             result = self.api.put(f"/students/{student_code}", data)
-            
+
             if 'error' not in result:
-                self.root.after(0, lambda: self.show_success("Student course updated successfully"))
-                self.root.after(0, lambda: self.update_code_entry.delete(0, 'end'))
-                self.root.after(0, self.refresh_students)
+                self._student_cache.pop(student_code, None)
+                self.root.event_generate("<<StudentUpdated>>", when="tail")
             else:
                 self.root.after(0, lambda: self.show_error("Failed to update student", result['error']))
-        
-        threading.Thread(target=update, daemon=True).start()
+
+        self._submit(update)
     
     # ==================== Grade Management Methods ====================
     
@@ -1911,27 +2367,30 @@ Grade Scale:
         student_code = self.grade_student_code_entry.get().strip()
         subject_code = self.subject_code_combobox.get().strip()
         
-        # Check if a valid subject is selected
-        if subject_code in ["Enter student code first...", "Select a subject code...", "No subjects available"]:
-            self.show_error("Validation Error", "Please select a valid subject code")
-            return
-        
         # Get subject name from stored data
         subject_name = self.subjects_data.get(subject_code, "")
-        
+
         grade_str = self.grade_entry.get().strip()
-        
-        if not all([student_code, subject_code, subject_name, grade_str]):
-            self.show_error("Validation Error", "Please fill in all fields")
-            return
-        
-        try:
+
+        # Collect every problem up front so the user sees one dialog, not several
+        errors = []
+        if not student_code:
+            errors.append("Student code is required")
+        if subject_code in self._PLACEHOLDERS or not subject_code:
+            errors.append("Please select a valid subject code")
+        elif not subject_name:
+            errors.append("Subject name could not be resolved for the selected subject")
+
+        grade = None
+        if not grade_str:
+            errors.append("Grade is required")
+        elif self._GRADE_RE.match(grade_str):
             grade = float(grade_str)
-            if grade < 1.0 or grade > 5.0:
-                self.show_error("Validation Error", "Grade must be between 1.0 and 5.0")
-                return
-        except ValueError:
-            self.show_error("Validation Error", "Invalid grade format. Use decimal format (e.g., 1.25)")
+        else:
+            errors.append("Grade must be between 1.0 and 5.0 in decimal format (e.g., 1.25)")
+
+        if errors:
+            self.show_error("Validation Error", "\n".join(errors))
             return
         
         def add():
@@ -1942,15 +2401,13 @@ Grade Scale:
                 'grade': grade
             }
             result = self.api.post("/grades", data)
-            
+
             if 'error' not in result:
-                self.root.after(0, lambda: self.show_success("Grade added successfully"))
-                self.root.after(0, self.clear_grade_form)
-                self.root.after(0, self.refresh_students)
+                self.root.event_generate("<<GradeAdded>>", when="tail")
             else:
                 self.root.after(0, lambda: self.show_error("Failed to add grade", result['error']))
-        
-        threading.Thread(target=add, daemon=True).start()
+
+        self._submit(add)
     
     def view_student_grades(self):
         """View grades for a specific student"""
@@ -1960,21 +2417,37 @@ Grade Scale:
             self.show_error("Validation Error", "Please enter student code")
             return
         
+        # Fetch student info (cached briefly - users often re-query the
+        # same student) in parallel with the grades request. Both tasks are
+        # submitted from the UI thread: queued FIFO, the student fetch is
+        # always dequeued before the task that joins it, so a full pool
+        # can't deadlock the way a nested submit could
+        student_future = self._submit(lambda: self._get_student_cached(student_code))
+
         def view():
             result = self.api.get(f"/grades/{student_code}")
-            
+
             if 'error' not in result:
-                # Also get student info
-                student_result = self.api.get(f"/students/{student_code}")
+                student_result = student_future.result()
                 if 'error' not in student_result:
                     self.root.after(0, lambda: self.update_grades_display(result, student_result))
                 else:
                     self.root.after(0, lambda: self.update_grades_tree(result))
             else:
                 self.root.after(0, lambda: self.show_error("Failed to load grades", result['error']))
-        
-        threading.Thread(target=view, daemon=True).start()
-    
+
+        self._submit(view)
+    
+    def _get_student_cached(self, student_code):
+        """Fetch student metadata, reusing a recent result when available"""
+        ts, data = self._student_cache.get(student_code, (0, None))
+        if data is not None and time.monotonic() - ts < self._student_cache_ttl:
+            return data
+        result = self.api.get(f"/students/{student_code}")
+        if 'error' not in result:
+            self._student_cache[student_code] = (time.monotonic(), result)
+        return result
+
     def update_grades_display(self, grades, student_info):
         """Update grades display with student info"""
         # Update info label
@@ -1988,67 +2461,129 @@ Grade Scale:
     
     def update_grades_tree(self, grades):
         """Update the grades treeview"""
-        # Clear existing items
-        for item in self.grades_tree.get_children():
-            self.grades_tree.delete(item)
-        
-        if not grades:
-            # Show message if no grades
-            return
-        
-        # Add grades to tree
-        for grade in grades:
-            self.grades_tree.insert("", "end", values=(
-                grade['subject_code'],
-                grade['subject_name'],
-                grade['formatted_grade'],
-                grade['description']
-            ))
+        self._bulk_fill_tree(self.grades_tree, [_GRADE_ROW(g) for g in grades])
     
     # ==================== Report Methods ====================
     
     def refresh_gwa_report(self):
-        """Refresh GWA report"""
+        """Refresh GWA report by streaming rows straight into the tree"""
+        if self._gwa_inflight is not None and not self._gwa_inflight.done():
+            return
+
+        # Only materialize the best rows in the tree unless the user
+        # asked for everything; statistics still cover the full stream
+        row_cap = None if self._gwa_show_all else self.GWA_ROW_CAP
+
+        # Keep the view toggle inert while a refresh is streaming so the
+        # button state can't drift from what the tree actually shows
+        self.gwa_show_all_button.configure(state="disabled")
+
         def refresh():
-            result = self.api.get("/gwa-report")
-            
-            if 'error' not in result:
-                self.root.after(0, lambda: self.update_gwa_report(result))
-            else:
-                self.root.after(0, lambda: self.show_error("Failed to load GWA report", result['error']))
-        
-        threading.Thread(target=refresh, daemon=True).start()
-    
-    def update_gwa_report(self, students):
-        """Update the GWA report treeview and statistics"""
-        # Clear existing items
-        for item in self.gwa_tree.get_children():
-            self.gwa_tree.delete(item)
-        
-        # Calculate statistics
-        total_students = len(students)
-        total_gwa = sum(s['gwa'] for s in students if s['gwa'] > 0)
-        students_with_gwa = len([s for s in students if s['gwa'] > 0])
-        avg_gwa = total_gwa / students_with_gwa if students_with_gwa > 0 else 0
-        excellent_count = len([s for s in students if 0 < s['gwa'] <= 1.75])
-        
-        # Update statistics boxes
-        self.total_students_label.value_label.configure(text=str(total_students))
-        self.avg_gwa_label.value_label.configure(text=f"{avg_gwa:.2f}" if avg_gwa > 0 else "N/A")
-        self.excellent_label.value_label.configure(text=str(excellent_count))
-        
-        # Add students to tree
-        for student in students:
-            self.gwa_tree.insert("", "end", values=(
-                student['student_code'],
-                student['name'],
-                student['course_code'],
-                student['formatted_gwa'],
-                student['description']
-            ))
+            try:
+                self._stream_gwa_report(row_cap)
+            finally:
+                self.root.after(0, lambda: self.gwa_show_all_button.configure(state="normal"))
+
+        self._gwa_inflight = self._submit(refresh)
+
+    def _stream_gwa_report(self, row_cap):
+        """Stream the GWA report into the tree, capped to the best row_cap rows"""
+        stream = self.api.stream("/gwa-report")
+
+        if isinstance(stream, dict):
+            self.root.after(0, lambda: self.show_error("Failed to load GWA report", stream['error']))
+            return
+
+        self.root.after(0, self._clear_gwa_report)
+
+        # Statistics as running sums so the full response never has to
+        # be materialized at once
+        total_students = 0
+        excellent_count = 0
+        gwa_vals = []
+        chunk = []
+        # Capped view: bounded max-heap of the best GWAs seen so far,
+        # as (-gwa, seq, row) so the worst kept row sits at the root
+        top = [] if row_cap is not None else None
+        seq = 0
+
+        for student in stream:
+            total_students += 1
+            gwa = student['gwa']
+            if gwa > 0:
+                gwa_vals.append(gwa)
+                if gwa <= 1.75:
+                    excellent_count += 1
+            code, name, course, gwa_str, desc = _GWA_ROW(student)
+            values = (code, name, _intern(course), gwa_str, _intern(desc))
+            if top is not None:
+                # Ungraded students (gwa == 0) rank below every real grade
+                key = gwa if gwa > 0 else math.inf
+                seq += 1
+                if len(top) < row_cap:
+                    heapq.heappush(top, (-key, seq, values))
+                elif key < -top[0][0]:
+                    heapq.heapreplace(top, (-key, seq, values))
+                continue
+            chunk.append(values)
+            if len(chunk) >= 100:
+                rows, chunk = chunk, []
+                self.root.after(0, lambda r=rows: self._append_gwa_rows(r))
+
+        if top is not None:
+            # Best GWA first; seq preserves the server's name order
+            # within equal grades
+            top.sort(key=lambda entry: (-entry[0], entry[1]))
+            ranked = [entry[2] for entry in top]
+            for start in range(0, len(ranked), 100):
+                self.root.after(0, lambda r=ranked[start:start + 100]: self._append_gwa_rows(r))
+        elif chunk:
+            self.root.after(0, lambda r=chunk: self._append_gwa_rows(r))
+
+        # fsum keeps the average exact even over many small grades
+        avg_gwa = math.fsum(gwa_vals) / len(gwa_vals) if gwa_vals else 0
+        self.root.after(0, lambda: self._update_gwa_stats(total_students, avg_gwa, excellent_count))
+
+    def _toggle_gwa_show_all(self):
+        """Switch the GWA report between the capped view and the full roster"""
+        self._gwa_show_all = not self._gwa_show_all
+        self.gwa_show_all_button.configure(
+            text=f"Top {self.GWA_ROW_CAP}" if self._gwa_show_all else "Show All"
+        )
+        self.refresh_gwa_report()
+
+    def _clear_gwa_report(self):
+        """Clear the GWA report tree before streaming in fresh rows"""
+        self.gwa_tree.delete(*self.gwa_tree.get_children())
+
+    def _append_gwa_rows(self, rows):
+        """Insert a chunk of streamed GWA report rows"""
+        for values in rows:
+            self.gwa_tree.insert("", "end", values=values)
+
+    @staticmethod
+    def _set_stat(box, text):
+        """Update a stat box label only when its text actually changed
+
+        CTk labels redraw their canvas on every configure call, so
+        skipping no-op updates keeps refreshes cheap.
+        """
+        label = box.value_label
+        if getattr(label, '_last_text', None) != text:
+            label.configure(text=text)
+            label._last_text = text
+
+    def _update_gwa_stats(self, total_students, avg_gwa, excellent_count):
+        """Update the GWA report statistics boxes"""
+        self._set_stat(self.total_students_label, str(total_students))
+        self._set_stat(self.avg_gwa_label, f"{avg_gwa:.2f}" if avg_gwa > 0 else "N/A")
+        self._set_stat(self.excellent_label, str(excellent_count))
     
     def refresh_analytics(self):
         """Refresh analytics dashboard"""
+        if self._analytics_inflight is not None and not self._analytics_inflight.done():
+            return
+
         def refresh():
             result = self.api.get("/analytics/overview")
             
@@ -2056,61 +2591,60 @@ Grade Scale:
                 self.root.after(0, lambda: self.update_analytics_dashboard(result))
             else:
                 self.root.after(0, lambda: self.show_error("Failed to load analytics", result['error']))
-        
-        threading.Thread(target=refresh, daemon=True).start()
+
+        self._analytics_inflight = self._submit(refresh)
     
     def update_analytics_dashboard(self, data):
         """Update analytics dashboard with data and charts"""
         # Update statistics
-        self.analytics_students_label.value_label.configure(text=str(data['total_students']))
-        self.analytics_courses_label.value_label.configure(text=str(data['total_courses']))
-        self.analytics_grades_label.value_label.configure(text=str(data['total_grades']))
-        self.analytics_avg_gwa_label.value_label.configure(
-            text=f"{data['overall_avg_gwa']:.2f}" if data['overall_avg_gwa'] > 0 else "N/A"
+        self._set_stat(self.analytics_students_label, str(data['total_students']))
+        self._set_stat(self.analytics_courses_label, str(data['total_courses']))
+        self._set_stat(self.analytics_grades_label, str(data['total_grades']))
+        self._set_stat(
+            self.analytics_avg_gwa_label,
+            f"{data['overall_avg_gwa']:.2f}" if data['overall_avg_gwa'] > 0 else "N/A"
         )
         
-        # Generate and display charts
-        self.generate_course_distribution_chart(data['course_distribution'])
-        self.generate_grade_distribution_chart(data['grade_distribution'])
-        self.generate_course_performance_chart(data['course_performance'])
-        
+        # Generate and display charts. Each build goes through its own
+        # event-loop pass so pending input events run between draws
+        # instead of waiting for all three charts
+        self.root.after(0, lambda: self.generate_course_distribution_chart(data['course_distribution']))
+        self.root.after(0, lambda: self.generate_grade_distribution_chart(data['grade_distribution']))
+        self.root.after(0, lambda: self.generate_course_performance_chart(data['course_performance']))
+
         # Update top performers
         self.update_top_performers(data['top_students'])
     
     def generate_course_distribution_chart(self, course_data):
         """Generate pie chart for students per course"""
-        if not course_data:
+        if not course_data['labels']:
             return
-        
-        # Set light theme for matplotlib
-        plt.style.use('default')
-        
-        fig, ax = plt.subplots(figsize=(5, 3.5), facecolor='white', dpi=80)
+
+        ax = self._course_ax
+        ax.clear()
         ax.set_facecolor('white')
-        
-        courses = [item['course'] for item in course_data]
-        counts = [item['count'] for item in course_data]
-        
+
+        courses = course_data['labels']
+        counts = course_data['counts']
+
         colors = ['#6366f1', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6']
-        
+
         ax.pie(counts, labels=courses, autopct='%1.1f%%', startangle=90, colors=colors[:len(courses)])
         ax.axis('equal')
-        
-        # Convert to image
-        self.display_chart(fig, self.course_chart_label)
+
+        self._course_fig.canvas.draw_idle()
     
     def generate_grade_distribution_chart(self, grade_data):
         """Generate bar chart for grade distribution"""
-        if not grade_data:
+        if not grade_data['labels']:
             return
-        
-        plt.style.use('default')
-        
-        fig, ax = plt.subplots(figsize=(5, 3.5), facecolor='white', dpi=80)
+
+        ax = self._grade_ax
+        ax.clear()
         ax.set_facecolor('white')
-        
-        ranges = [item['range'] for item in grade_data]
-        counts = [item['count'] for item in grade_data]
+
+        ranges = grade_data['labels']
+        counts = grade_data['counts']
         
         colors = ['#10b981', '#3b82f6', '#f59e0b', '#fb923c', '#ef4444']
         
@@ -2127,22 +2661,20 @@ Grade Scale:
                 ax.text(bar.get_x() + bar.get_width()/2., height,
                        f'{int(height)}',
                        ha='center', va='bottom', fontsize=8)
-        
-        plt.tight_layout()
-        self.display_chart(fig, self.grade_chart_label)
+
+        self._grade_fig.canvas.draw_idle()
     
     def generate_course_performance_chart(self, performance_data):
         """Generate bar chart for average GWA per course"""
-        if not performance_data:
+        if not performance_data['labels']:
             return
-        
-        plt.style.use('default')
-        
-        fig, ax = plt.subplots(figsize=(7, 3.5), facecolor='white', dpi=80)
+
+        ax = self._perf_ax
+        ax.clear()
         ax.set_facecolor('white')
-        
-        courses = [item['course'] for item in performance_data]
-        avg_gwas = [item['avg_gwa'] for item in performance_data]
+
+        courses = performance_data['labels']
+        avg_gwas = performance_data['avg_gwa']
         
         colors = ['#10b981' if gwa <= 1.75 else '#3b82f6' if gwa <= 2.5 else '#f59e0b' 
                   for gwa in avg_gwas]
@@ -2164,48 +2696,29 @@ Grade Scale:
         ax.axhline(y=2.5, color='#3b82f6', linestyle='--', alpha=0.6, label='Good')
         ax.axhline(y=3.0, color='#f59e0b', linestyle='--', alpha=0.6, label='Satisfactory')
         ax.legend(fontsize=8)
-        
-        plt.tight_layout()
-        self.display_chart(fig, self.performance_chart_label)
-    
-    def display_chart(self, fig, label_widget):
-        """Convert matplotlib figure to image and display in label"""
-        # Save figure to bytes buffer with optimized DPI for performance
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', dpi=80, facecolor='white', bbox_inches='tight')
-        buf.seek(0)
-        plt.close(fig)
-        
-        # Convert to PhotoImage
-        image = Image.open(buf)
-        # Resize for better fit if needed
-        photo = ImageTk.PhotoImage(image)
-        
-        # Update label
-        label_widget.configure(image=photo, text="")
-        label_widget.image = photo  # Keep a reference to prevent garbage collection
-        buf.close()  # Clean up buffer
+
+        self._perf_fig.canvas.draw_idle()
     
     def update_top_performers(self, top_students):
         """Update top performers treeview"""
-        # Clear existing items
-        for item in self.top_performers_tree.get_children():
-            self.top_performers_tree.delete(item)
-        
-        # Add top students
-        for rank, student in enumerate(top_students, 1):
-            self.top_performers_tree.insert("", "end", values=(
+        rows = [
+            (
                 f"#{rank}",
                 student['student_code'],
                 student['name'],
                 student['course_code'],
                 f"{student['gwa']:.2f}"
-            ))
+            )
+            for rank, student in enumerate(top_students, 1)
+        ]
+        self._bulk_fill_tree(self.top_performers_tree, rows)
     
     # ==================== Helper Methods ====================
     
-    def get_grade_description(self, grade: float) -> str:
-        """Get description for a grade"""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get_grade_description(grade: float) -> str:
+        """Get description for a grade (grades quantize to few values, so cached)"""
         if grade == 0:
             return "Not yet graded"
         elif grade == 1.0:
@@ -2225,17 +2738,31 @@ Grade Scale:
         self.name_entry.delete(0, 'end')
     
     def load_subjects_for_student(self):
-        """Load subjects based on student's course"""
+        """Load subjects based on student's course (debounced)"""
         student_code = self.grade_student_code_entry.get().strip()
-        
+
         if not student_code:
             self.show_error("Validation Error", "Please enter a student code")
             return
-        
+
+        # Mashing Enter bumps the token; only the latest press survives the
+        # 200ms debounce window and stale responses never touch the combobox
+        self._subj_token += 1
+        token = self._subj_token
+        self.root.after(200, lambda: self._do_load_subjects(student_code, token))
+
+    def _do_load_subjects(self, student_code, token):
+        """Fire the debounced subject fetch if it is still the latest"""
+        if token != self._subj_token:
+            return
+
         def load():
-            # Get student info to find their course
-            student_result = self.api.get(f"/students/{student_code}")
-            
+            # Find the student's course - the local index avoids a round-trip
+            # for students already in the loaded list
+            student_result = self._students_by_code.get(student_code)
+            if student_result is None:
+                student_result = self.api.get(f"/students/{student_code}")
+
             if 'error' in student_result:
                 self.root.after(0, lambda: self.show_error("Student Not Found", 
                     "Could not find student with that code. Please check and try again."))
@@ -2255,6 +2782,10 @@ Grade Scale:
                 self.root.after(0, lambda: self.subject_code_combobox.set("No subjects available"))
                 return
             
+            # A newer request superseded this one while it was in flight
+            if token != self._subj_token:
+                return
+
             # Store subject data and prepare dropdown values
             self.subjects_data = {}
             subject_codes = []
@@ -2263,13 +2794,13 @@ Grade Scale:
                 subject_name = subject['subject_name']
                 self.subjects_data[subject_code] = subject_name
                 subject_codes.append(subject_code)
-            
+
             # Update combobox
             self.root.after(0, lambda: self.subject_code_combobox.configure(values=subject_codes))
             self.root.after(0, lambda: self.subject_code_combobox.set("Select a subject code..."))
             self.root.after(0, lambda: self.show_success(f"Loaded {len(subject_codes)} subjects for {course_code}"))
-        
-        threading.Thread(target=load, daemon=True).start()
+
+        self._submit(load)
     
     def on_subject_selected(self, selected_code):
         """Handle subject code selection - auto-fill subject name"""
@@ -2295,6 +2826,7 @@ Grade Scale:
     
     def generate_qr_code(self, student_code, student_name):
         """Generate QR code for a student"""
+        import qrcode
         try:
             # Create QR code
             qr = qrcode.QRCode(
@@ -2322,25 +2854,46 @@ Grade Scale:
     
     def scan_qr_code(self, entry_widget):
         """Scan QR code using camera and fill the entry widget"""
+        # Camera stack is heavy (~40MB of shared libs); load it only when
+        # the user actually scans
+        import cv2
+        from pyzbar.pyzbar import decode
         def scan():
             try:
                 cap = cv2.VideoCapture(0)
                 if not cap.isOpened():
                     self.root.after(0, lambda: self.show_error("Camera Error", "Could not access camera"))
                     return
-                
+
+                # Decode throughput is roughly linear in pixel count, so
+                # ask the camera for 640x480 rather than its native size
+                cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+                # Keep only the latest frame in the driver queue so slow
+                # decode iterations don't build up a stale backlog
+                cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
                 # Create a small window for camera feed
                 cv2.namedWindow("QR Code Scanner - Press ESC to cancel", cv2.WINDOW_NORMAL)
                 cv2.resizeWindow("QR Code Scanner - Press ESC to cancel", 640, 480)
-                
+
                 scanned = False
+                frame_idx = 0
                 while not scanned:
                     ret, frame = cap.read()
                     if not ret:
                         break
-                    
-                    # Decode QR codes in frame
-                    decoded_objects = decode(frame)
+
+                    # Decoding dominates the loop, so try every other frame;
+                    # that still samples the camera ~15x/s at half the CPU
+                    frame_idx += 1
+                    if frame_idx % 2:
+                        # Decode on a single grayscale channel - a third of
+                        # the bytes pyzbar has to walk per frame
+                        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                        decoded_objects = decode(gray)
+                    else:
+                        decoded_objects = ()
                     
                     for obj in decoded_objects:
                         # Draw rectangle around QR code
@@ -2386,8 +2939,8 @@ Grade Scale:
                 
             except Exception as e:
                 self.root.after(0, lambda: self.show_error("Scan Error", f"Error scanning QR code: {str(e)}"))
-        
-        threading.Thread(target=scan, daemon=True).start()
+
+        self._submit(scan)
     
     def show_student_qr_code(self):
         """Show QR code for selected student"""
@@ -2424,21 +2977,23 @@ Grade Scale:
         ctk.CTkLabel(
             info_frame,
             text=f"{student_name}",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.fonts['h2']
         ).pack(pady=(10, 5))
         
         ctk.CTkLabel(
             info_frame,
             text=f"Student Code: {student_code}",
-            font=ctk.CTkFont(size=14)
+            font=self.fonts['body_lg']
         ).pack(pady=(0, 10))
         
         # Display QR code
         try:
-            img = Image.open(filepath)
-            img = img.resize((300, 300), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-            
+            photo = self._qr_cache.get(student_code)
+            if photo is None:
+                img = Image.open(filepath)
+                img = img.resize((300, 300), Image.Resampling.LANCZOS)
+                photo = self._qr_cache[student_code] = ImageTk.PhotoImage(img)
+
             qr_label = tk.Label(qr_window, image=photo, bg="white")
             qr_label.image = photo  # Keep a reference
             qr_label.pack(pady=10)
@@ -2446,28 +3001,32 @@ Grade Scale:
             ctk.CTkLabel(
                 qr_window,
                 text=f"Error loading QR code:\n{str(e)}",
-                font=ctk.CTkFont(size=12)
+                font=self.fonts['label']
             ).pack(pady=20)
         
         # Instructions
         ctk.CTkLabel(
             qr_window,
             text="Scan this QR code for quick student lookup",
-            font=ctk.CTkFont(size=11),
+            font=self.fonts['caption'],
             text_color="gray70"
         ).pack(pady=(10, 20))
     
     def show_success(self, message):
-        """Show success message"""
-        messagebox.showinfo("Success", message)
-    
+        """Show a non-blocking success toast"""
+        _Toast(self.root, message, kind='success')
+
     def show_error(self, title, message):
-        """Show error message"""
-        messagebox.showerror(title, message)
+        """Show a non-blocking error toast"""
+        _Toast(self.root, f"{title}\n{message}", kind='error', duration=4000)
     
     def back_to_menu(self):
         """Return to main menu"""
         if messagebox.askyesno("Return to Menu", "Do you want to return to the main menu?"):
+            # Release this app's worker pool and connection pool before
+            # relaunching - a fresh EduCoreApp builds its own
+            self._executor.shutdown(wait=False)
+            self.api.close()
             self.root.destroy()
             # Relaunch menu
             menu = MenuWindow(self.user_data, self.api)
@@ -2509,7 +3068,25 @@ class StudentPortalWindow:
             'secondary': '#8b5cf6',
             'bg_light': '#f9fafb'
         }
-        
+
+        # Shared font palette for the per-render dashboard widgets; fonts
+        # are bound to this window's Tk interpreter so they live here, not
+        # at class level
+        self.fonts = {
+            'caption': ctk.CTkFont(size=11),
+            'small': ctk.CTkFont(size=12),
+            'label': ctk.CTkFont(size=13),
+            'label_bold': ctk.CTkFont(size=13, weight="bold"),
+            'body': ctk.CTkFont(size=14),
+            'button': ctk.CTkFont(size=15, weight="bold"),
+            'h4': ctk.CTkFont(size=18, weight="bold"),
+            'h3': ctk.CTkFont(size=20, weight="bold"),
+            'h2': ctk.CTkFont(size=24, weight="bold"),
+            'h1': ctk.CTkFont(size=26, weight="bold"),
+            'display': ctk.CTkFont(size=32, weight="bold"),
+            'gwa': ctk.CTkFont(size=48, weight="bold"),
+        }
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -2526,14 +3103,14 @@ class StudentPortalWindow:
         ctk.CTkLabel(
             title_frame,
             text="👨‍🎓 Student Portal",
-            font=ctk.CTkFont(size=32, weight="bold"),
+            font=self.fonts['display'],
             text_color="white"
         ).pack(anchor="w")
         
         ctk.CTkLabel(
             title_frame,
             text="View your grades and academic performance",
-            font=ctk.CTkFont(size=13),
+            font=self.fonts['label'],
             text_color="#d1fae5"
         ).pack(anchor="w")
         
@@ -2545,7 +3122,7 @@ class StudentPortalWindow:
             width=140,
             height=40,
             corner_radius=10,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self.fonts['label_bold'],
             fg_color="white",
             text_color="#10b981",
             hover_color="#f0fdf4"
@@ -2582,13 +3159,13 @@ class StudentPortalWindow:
         ctk.CTkLabel(
             scan_card,
             text="Scan Your Student QR Code",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.fonts['h2']
         ).pack(pady=(0, 10))
         
         ctk.CTkLabel(
             scan_card,
             text="Click the button below to scan your QR code\nor enter your student code manually",
-            font=ctk.CTkFont(size=13),
+            font=self.fonts['label'],
             text_color="#6b7280"
         ).pack(pady=(0, 30))
         
@@ -2600,7 +3177,7 @@ class StudentPortalWindow:
             entry_frame,
             placeholder_text="Enter Student Code (e.g., 24-49051)",
             height=45,
-            font=ctk.CTkFont(size=13),
+            font=self.fonts['label'],
             corner_radius=10,
             border_width=2,
             border_color="#e5e7eb"
@@ -2615,7 +3192,7 @@ class StudentPortalWindow:
             command=self.scan_qr_and_load,
             height=50,
             corner_radius=10,
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=self.fonts['button'],
             fg_color=self.colors['primary'],
             hover_color=self.colors['primary_dark']
         ).pack(fill="x", pady=(0, 10))
@@ -2626,28 +3203,44 @@ class StudentPortalWindow:
             command=self.load_student_data,
             height=50,
             corner_radius=10,
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=self.fonts['button'],
             fg_color=self.colors['info'],
             hover_color="#2563eb"
         ).pack(fill="x")
         
     def scan_qr_and_load(self):
         """Scan QR code and load student data"""
+        import cv2
+        from pyzbar.pyzbar import decode
+
         def scan():
             try:
                 cap = cv2.VideoCapture(0)
                 if not cap.isOpened():
                     self.window.after(0, lambda: messagebox.showerror("Camera Error", "Could not access camera"))
                     return
-                
+
+                cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+                # Keep only the latest frame in the driver queue so slow
+                # decode iterations don't build up a stale backlog
+                cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
                 self.window.after(0, lambda: messagebox.showinfo("QR Scanner", "Position your QR code in front of the camera.\nPress 'Q' to cancel."))
-                
+
+                frame_idx = 0
                 while True:
                     ret, frame = cap.read()
                     if not ret:
                         break
-                    
-                    decoded_objects = decode(frame)
+
+                    # Decode every other frame - see scan_qr_code
+                    frame_idx += 1
+                    if frame_idx % 2:
+                        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                        decoded_objects = decode(gray)
+                    else:
+                        decoded_objects = ()
                     
                     for obj in decoded_objects:
                         student_code = obj.data.decode('utf-8')
@@ -2701,6 +3294,26 @@ class StudentPortalWindow:
         
         threading.Thread(target=load, daemon=True).start()
         
+    def _configure_student_treeview_style(self):
+        """Configure the portal treeview style once per window"""
+        if getattr(self, '_portal_style_ready', False):
+            return
+        style = ttk.Style()
+        style.configure("Student.Treeview",
+                      background="#ffffff",
+                      foreground="#111827",
+                      fieldbackground="#ffffff",
+                      rowheight=35,
+                      font=('Segoe UI', 11))
+        style.configure("Student.Treeview.Heading",
+                      background="#10b981",
+                      foreground="white",
+                      font=('Segoe UI', 12, 'bold'))
+        style.map('Student.Treeview',
+                 background=[('selected', '#d1fae5')],
+                 foreground=[('selected', '#065f46')])
+        self._portal_style_ready = True
+
     def show_student_dashboard(self, student_info, grades_data):
         """Show student dashboard with grades and analytics"""
         # Clear main container
@@ -2724,7 +3337,7 @@ class StudentPortalWindow:
         ctk.CTkLabel(
             info_content,
             text=student_info['name'],
-            font=ctk.CTkFont(size=26, weight="bold"),
+            font=self.fonts['h1'],
             text_color="white"
         ).pack(anchor="w")
         
@@ -2734,7 +3347,7 @@ class StudentPortalWindow:
         ctk.CTkLabel(
             details_frame,
             text=f"Student Code: {student_info['student_code']}  •  Course: {student_info['course_code']}",
-            font=ctk.CTkFont(size=14),
+            font=self.fonts['body'],
             text_color="#d1fae5"
         ).pack(side="left")
         
@@ -2750,7 +3363,7 @@ class StudentPortalWindow:
         ctk.CTkLabel(
             gwa_frame,
             text="General Weighted Average (GWA)",
-            font=ctk.CTkFont(size=14),
+            font=self.fonts['body'],
             text_color="#6b7280"
         ).pack(anchor="w")
         
@@ -2760,14 +3373,14 @@ class StudentPortalWindow:
         ctk.CTkLabel(
             gwa_display_frame,
             text=gwa_value,
-            font=ctk.CTkFont(size=48, weight="bold"),
+            font=self.fonts['gwa'],
             text_color=gwa_color
         ).pack(side="left", padx=(0, 15))
         
         ctk.CTkLabel(
             gwa_display_frame,
             text=f"• {gwa_status}",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self.fonts['h4'],
             text_color=gwa_color
         ).pack(side="left")
         
@@ -2778,7 +3391,7 @@ class StudentPortalWindow:
         ctk.CTkLabel(
             grades_card,
             text="📝 Your Grades",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self.fonts['h3']
         ).pack(anchor="w", padx=20, pady=(20, 15))
         
         if grades_data:
@@ -2786,21 +3399,9 @@ class StudentPortalWindow:
             tree_frame = ctk.CTkFrame(grades_card)
             tree_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
             
-            style = ttk.Style()
-            style.configure("Student.Treeview",
-                          background="#ffffff",
-                          foreground="#111827",
-                          fieldbackground="#ffffff",
-                          rowheight=35,
-                          font=('Segoe UI', 11))
-            style.configure("Student.Treeview.Heading",
-                          background="#10b981",
-                          foreground="white",
-                          font=('Segoe UI', 12, 'bold'))
-            style.map('Student.Treeview',
-                     background=[('selected', '#d1fae5')],
-                     foreground=[('selected', '#065f46')])
-            
+            self._configure_student_treeview_style()
+
+
             grades_tree = ttk.Treeview(
                 tree_frame,
                 columns=("Subject Code", "Subject Name", "Grade", "Status"),
@@ -2839,7 +3440,7 @@ class StudentPortalWindow:
             ctk.CTkLabel(
                 grades_card,
                 text="No grades recorded yet",
-                font=ctk.CTkFont(size=14),
+                font=self.fonts['body'],
                 text_color="#6b7280"
             ).pack(pady=30)
         
@@ -2851,7 +3452,7 @@ class StudentPortalWindow:
         ctk.CTkLabel(
             analysis_card,
             text="📊 Performance Analysis",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self.fonts['h3']
         ).pack(anchor="w", padx=20, pady=(20, 15))
         
         content_frame = ctk.CTkFrame(analysis_card, fg_color="transparent")
@@ -2883,7 +3484,7 @@ class StudentPortalWindow:
             ctk.CTkLabel(
                 strength_frame,
                 text="💪 Your Strengths",
-                font=ctk.CTkFont(size=15, weight="bold"),
+                font=self.fonts['button'],
                 text_color="#065f46"
             ).pack(anchor="w", padx=15, pady=(15, 10))
             
@@ -2891,7 +3492,7 @@ class StudentPortalWindow:
                 ctk.CTkLabel(
                     strength_frame,
                     text=f"• {strength}",
-                    font=ctk.CTkFont(size=12),
+                    font=self.fonts['small'],
                     text_color="#047857",
                     anchor="w"
                 ).pack(anchor="w", padx=15, pady=2)
@@ -2905,7 +3506,7 @@ class StudentPortalWindow:
             ctk.CTkLabel(
                 improve_frame,
                 text="📈 Areas for Improvement",
-                font=ctk.CTkFont(size=15, weight="bold"),
+                font=self.fonts['button'],
                 text_color="#92400e"
             ).pack(anchor="w", padx=15, pady=(15, 10))
             
@@ -2913,7 +3514,7 @@ class StudentPortalWindow:
                 ctk.CTkLabel(
                     improve_frame,
                     text=f"• {improvement}",
-                    font=ctk.CTkFont(size=12),
+                    font=self.fonts['small'],
                     text_color="#b45309",
                     anchor="w"
                 ).pack(anchor="w", padx=15, pady=2)
@@ -2927,7 +3528,7 @@ class StudentPortalWindow:
         ctk.CTkLabel(
             message_frame,
             text="💡 " + recommendations['message'],
-            font=ctk.CTkFont(size=13),
+            font=self.fonts['label'],
             text_color="#1e40af",
             wraplength=800,
             justify="left"
@@ -2940,14 +3541,14 @@ class StudentPortalWindow:
         ctk.CTkLabel(
             box,
             text=title,
-            font=ctk.CTkFont(size=11),
+            font=self.fonts['caption'],
             text_color="white"
         ).pack(pady=(12, 5))
         
         ctk.CTkLabel(
             box,
             text=value,
-            font=ctk.CTkFont(size=32, weight="bold"),
+            font=self.fonts['display'],
             text_color="white"
         ).pack(pady=(0, 12))
         